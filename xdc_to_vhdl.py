@@ -7,8 +7,116 @@
 import re
 import sys
 import os
-import argparse
-from collections import defaultdict
+from collections import defaultdict, Counter
+
+# Matches a whole set_property line, compiled once at import time and run over the
+# raw bytes of the entire file with finditer (XDC files are ASCII, so nothing is decoded
+# until a port name is captured). set_property must start the line, apart from an optional
+# UTF-8 byte order mark or code ending in { or ; (as in "{set_property ...}" or
+# "cmd; set_property ..."), so comment lines never match; [ \t] and . keep each match
+# from running onto the next line.
+# Groups: 1 = bus base name, 2 = bus index, 3 = scalar name, 4 = direction from a #! or ##! comment
+_LINE_RE = re.compile(rb'^(?:\xef\xbb\xbf)?(?:[^#\n]*?[{;])??[ \t]*set_property\b.*?get_ports[ \t]+\{?(?:(\w+)\[(\d+)\]\}|(\w+))(?:.*?#+![ \t]*(INOUT|IN|OUT))?',
+                      re.MULTILINE)
+
+# Fixed parts of the file around the port list: {n} = entity name
+_HEADER_TMPL = (
+    "library IEEE;\n"
+    "use IEEE.STD_LOGIC_1164.ALL;\n"
+    "use IEEE.NUMERIC_STD.ALL;\n\n"
+    "-- Entity generated automatically from XDC file\n"
+    "-- Port directions extracted from #! or ##! comments\n"
+    "entity {n} is\n"
+    "    Port (\n"
+)
+_ENTITY_END_TMPL = (
+    "    );\n"
+    "end entity {n};\n\n"
+    "architecture Behavioral of {n} is\n"
+)
+
+# Per-port output templates: {n} = port name, {r} = bus range such as "(7 downto 0)"
+_INOUT_SIGNAL_TMPL = (
+    "    signal {n}_In  : std_logic; -- Input from {n}\n"
+    "    signal {n}_Out : std_logic := '0'; -- Output to {n}\n"
+    "    signal {n}_Dir : std_logic := '0'; -- Direction control for {n} (1=output, 0=input)\n"
+)
+_INOUT_BUS_SIGNAL_TMPL = (
+    "    signal {n}_In  : std_logic_vector{r}; -- Input from {n}\n"
+    "    signal {n}_Out : std_logic_vector{r} := (others => '0'); -- Output to {n}\n"
+    "    signal {n}_Dir : std_logic := '0'; -- Direction control for {n} (1=output, 0=input)\n"
+)
+_INOUT_ASSIGN_TMPL = (
+    "    -- INOUT port {n} requires special handling\n"
+    "    {n}_In <= {n};\n"
+    "    {n} <= {n}_Out when {n}_Dir = '1' else 'Z';\n"
+    "    -- Control {n}_Dir to switch between input and output modes\n\n"
+)
+_INOUT_BUS_ASSIGN_TMPL = (
+    "    -- INOUT bus {n} requires special handling\n"
+    "    {n}_In <= {n};\n"
+    "    {n} <= {n}_Out when {n}_Dir = '1' else (others => 'Z');\n"
+    "    -- Control {n}_Dir to switch between input and output modes\n\n"
+)
+_INOUT_EXAMPLE_TMPL = (
+    "    -- Example usage for {n}:\n"
+    "    -- {n}_Out <= some_internal_signal; -- Drive output\n"
+    "    -- some_other_signal <= {n}_In;     -- Read input\n"
+    "    -- {n}_Dir <= '1' when output_enable else '0'; -- Control direction\n\n"
+)
+_INOUT_BUS_EXAMPLE_TMPL = (
+    "    -- Example usage for {n}:\n"
+    "    -- {n}_Out <= some_internal_bus; -- Drive output\n"
+    "    -- some_other_bus <= {n}_In;     -- Read input\n"
+    "    -- {n}_Dir <= '1' when output_enable else '0'; -- Control direction\n\n"
+)
+
+# Templates keyed by port direction; anything not listed falls back to the default
+_SIGNAL_TMPLS = {"inout": _INOUT_SIGNAL_TMPL}
+_SIGNAL_DEFAULT_TMPL = "    signal {n}_Int : std_logic := '0';\n"
+_BUS_SIGNAL_TMPLS = {"inout": _INOUT_BUS_SIGNAL_TMPL}
+_BUS_SIGNAL_DEFAULT_TMPL = "    signal {n}_Int : std_logic_vector{r} := (others => '0');\n"
+_ASSIGN_TMPLS = {
+    "in": "    {n}_Int <= {n};\n",
+    "out": "    {n} <= {n}_Int;\n",
+    "inout": _INOUT_ASSIGN_TMPL,
+}
+_BUS_ASSIGN_TMPLS = {
+    "in": "    {n}_Int <= {n};\n",
+    "out": "    {n} <= {n}_Int;\n",
+    "inout": _INOUT_BUS_ASSIGN_TMPL,
+}
+_ASSIGN_DEFAULT_TMPL = "    -- Direction not specified for {n}, add assignment manually\n"
+
+# Command line help, laid out the same way argparse would print it: {prog} = script name
+_USAGE_TMPL = "usage: {prog} [-h] [-s] [-as] input_file output_file\n"
+_HELP_TMPL = _USAGE_TMPL + (
+    "\n"
+    "Convert XDC file to VHDL entity with optional signal declarations and\n"
+    "assignments\n"
+    "\n"
+    "positional arguments:\n"
+    "  input_file            Input XDC file\n"
+    "  output_file           Output VHDL file\n"
+    "\n"
+    "options:\n"
+    "  -h, --help            show this help message and exit\n"
+    "  -s, --signals         Generate internal signal declarations\n"
+    "  -as, --assign-signals\n"
+    "                        Generate signal declarations and assignments between\n"
+    "                        ports and signals\n"
+)
+
+# Command line options: each spelling maps to (name shown in error messages, flag it sets)
+_OPTIONS = {
+    '-h': ('-h/--help', 'help'),
+    '--help': ('-h/--help', 'help'),
+    '-s': ('-s/--signals', 'signals'),
+    '--signals': ('-s/--signals', 'signals'),
+    '-as': ('-as/--assign-signals', 'assign'),
+    '--assign-signals': ('-as/--assign-signals', 'assign'),
+}
+_NEGATIVE_NUMBER_RE = re.compile(r'^-\d+$|^-\d*\.\d+$')
 
 def parse_xdc(filename):
     """
@@ -16,53 +124,154 @@ def parse_xdc(filename):
     Handles both scalar ports (e.g., 'clk') and bus ports (e.g., 'leds[0]').
     Only processes set_property lines to avoid duplicates from other commands like create_clock.
     """
-    port_regex = re.compile(r'get_ports\s+{?(\w+)\[(\d+)\]}|get_ports\s+{?(\w+)}?')
-    # Updated to recognize both #! and ##! for direction comments
-    direction_regex = re.compile(r'\s*#+!\s*(INOUT|IN|OUT)')
-    
-    ports_dict = defaultdict(list)  # Key: port base name, Value: list of (index, direction) tuples
+    # Key: port base name, Value: bus summary built up while parsing (seen indices,
+    # highest/lowest index and a count of each direction comment)
+    ports_dict = defaultdict(lambda: {'seen': set(), 'hi': -1, 'lo': sys.maxsize, 'dir_counts': Counter()})
     scalars = {}                    # Dictionary of scalar port names and their directions
 
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                # Skip comment-only lines
-                if line.strip().startswith('#'):
-                    continue
-                    
-                # Only process lines that contain set_property to avoid duplicates
-                if "set_property" not in line:
-                    continue
-                    
-                # Find direction comment if present
-                direction_match = direction_regex.search(line)
-                direction = direction_match.group(1).lower() if direction_match else None
-                
-                # Find all matches for get_ports patterns
-                match = port_regex.search(line)
-                if match:
-                    # Check if it's a bus or a scalar
-                    if match.group(1) is not None:
-                        # It's a bus: group(1) is base name, group(2) is index
-                        base_name = match.group(1)
-                        index = int(match.group(2))
-                        
-                        # Only add if this port+index combination hasn't been processed yet
-                        if not any(idx == index for idx, _ in ports_dict[base_name]):
-                            ports_dict[base_name].append((index, direction))
-                    elif match.group(3) is not None:
-                        # It's a scalar
-                        port_name = match.group(3)
-                        
-                        # Only add if this port hasn't been processed yet
-                        if port_name not in scalars:
-                            scalars[port_name] = direction
+        with open(filename, 'rb') as f:
+            # Binary mode has no universal newlines, so turn CRLF and CR-only line
+            # endings into \n ourselves; otherwise ^ would not see each line start
+            data = f.read().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         sys.exit(1)
 
+    # Only set_property lines match, which avoids duplicates from other commands
+    for match in _LINE_RE.finditer(data):
+        # Direction comment if present
+        direction = match.group(4).decode('ascii').lower() if match.group(4) else None
+
+        # Check if it's a bus or a scalar
+        if match.group(1) is not None:
+            # It's a bus: group(1) is base name, group(2) is index. Names are interned so
+            # the repeated dictionary lookups for each bit of a bus compare by identity
+            base_name = sys.intern(match.group(1).decode('ascii'))
+            index = int(match.group(2))
+
+            # Only add if this port+index combination hasn't been processed yet
+            bus = ports_dict[base_name]
+            if index not in bus['seen']:
+                bus['seen'].add(index)
+                bus['hi'] = max(bus['hi'], index)
+                bus['lo'] = min(bus['lo'], index)
+                if direction:
+                    bus['dir_counts'][direction] += 1
+        else:
+            # It's a scalar
+            port_name = sys.intern(match.group(3).decode('ascii'))
+
+            # Only add if this port hasn't been processed yet
+            if port_name not in scalars:
+                scalars[port_name] = direction
+
     return ports_dict, scalars
 
+def _majority(dir_counts):
+    """
+    Returns the most common direction in a bus's direction Counter, or None if no
+    direction comment was found for any of its bits.
+    On a tie, the direction seen first in the XDC file wins.
+    """
+    return dir_counts.most_common(1)[0][0] if dir_counts else None
+
+def _usage_error(prog, message):
+    """
+    Prints the usage line and an error message to stderr and exits with status 2.
+    """
+    sys.stderr.write(_USAGE_TMPL.format(prog=prog) + f"{prog}: error: {message}\n")
+    sys.exit(2)
+
+def _match_option(arg):
+    """
+    Looks up a command line option the way argparse does: an exact spelling, an
+    option=value form, a unique prefix of a --long option or of -as, or a single-dash
+    option with more text run on after it (as in -ss or -s1).
+    Returns (option, explicit_value), where explicit_value is None if nothing followed
+    the option, or None if arg is not a known option.
+    """
+    if arg in _OPTIONS:
+        return arg, None
+    if '=' in arg:
+        option, value = arg.split('=', 1)
+        if option in _OPTIONS:
+            return option, value
+
+    if arg.startswith('--'):
+        prefix, sep, value = arg.partition('=')
+        matches = [(option, value if sep else None) for option in _OPTIONS if option.startswith(prefix)]
+    else:
+        matches = []
+        for option in _OPTIONS:
+            if option == arg[:2]:
+                matches.append((option, arg[2:]))
+            elif option.startswith(arg):
+                matches.append((option, None))
+
+    # None of the options share a prefix, so a match is never ambiguous
+    return matches[0] if matches else None
+
+def parse_args(argv, prog):
+    """
+    Parses the command line arguments (without the program name); prog is the
+    script name used in the help and error messages.
+    Returns (input_file, output_file, generate_signals, generate_assignments).
+    Walks argv by hand rather than using argparse, which keeps start-up fast when
+    the script is called many times from a build script, but accepts the same
+    spellings argparse did (--sig, --assign, -a, -ss, ...) and reports the same errors.
+    """
+    positionals = []
+    extras = []             # Unknown options and surplus positionals, in command line order
+    generate_signals = False
+    generate_assignments = False
+    options_done = False
+
+    for arg in argv:
+        if options_done or arg == '-' or not arg.startswith('-'):
+            (positionals if len(positionals) < 2 else extras).append(arg)
+            continue
+        if arg == '--':
+            options_done = True
+            continue
+
+        match = _match_option(arg)
+        if match is None:
+            # Like argparse, negative numbers and arguments containing spaces are positionals
+            if _NEGATIVE_NUMBER_RE.match(arg) or ' ' in arg:
+                (positionals if len(positionals) < 2 else extras).append(arg)
+            else:
+                extras.append(arg)
+            continue
+
+        # Text run on after a single-dash option is read as more single-letter options
+        option, value = match
+        options = [option]
+        while value is not None:
+            next_option = '-' + value[:1]
+            if option.startswith('--') or next_option not in _OPTIONS:
+                _usage_error(prog, f"argument {_OPTIONS[option][0]}: ignored explicit argument {value!r}")
+            option, value = next_option, value[1:] or None
+            options.append(option)
+
+        for option in options:
+            flag = _OPTIONS[option][1]
+            if flag == 'help':
+                sys.stdout.write(_HELP_TMPL.format(prog=prog))
+                sys.exit(0)
+            elif flag == 'signals':
+                generate_signals = True
+            else:
+                generate_assignments = True
+
+    if len(positionals) < 2:
+        missing = ['input_file', 'output_file'][len(positionals):]
+        _usage_error(prog, f"the following arguments are required: {', '.join(missing)}")
+    if extras:
+        _usage_error(prog, f"unrecognized arguments: {' '.join(extras)}")
+
+    return positionals[0], positionals[1], generate_signals, generate_assignments
+
 def generate_vhdl_entity(ports_dict, scalars, output_filename, generate_signals=False, generate_assignments=False):
     """
     Generates a complete VHDL entity declaration from the parsed port information.
@@ -70,189 +279,103 @@ def generate_vhdl_entity(ports_dict, scalars, output_filename, generate_signals=
     """
     # Extract entity name from filename (remove extension)
     entity_name = os.path.splitext(os.path.basename(output_filename))[0]
+
+    # Sort the ports once and work out each bus's range string and direction once (use the
+    # most common direction if multiple specified); every section below reads from these.
+    # The range is always written as downto, by convention.
+    scalars_sorted = sorted(scalars.items())
+    buses_sorted = []
+    for base_name, bus in sorted(ports_dict.items()):
+        range_str = f"({bus['hi']} downto {bus['lo']})"
+        buses_sorted.append((base_name, (range_str, _majority(bus['dir_counts']))))
+
+    # Collect the whole file in memory and write it out in one go
+    out = []
+
+    # Write VHDL header with standard libraries
+    out.append(_HEADER_TMPL.format(n=entity_name))
+
+    # Collect all ports for proper comma/semicolon handling
+    all_ports = []
     
-    with open(output_filename, 'w') as f:
-        # Write VHDL header with standard libraries
-        f.write("library IEEE;\n")
-        f.write("use IEEE.STD_LOGIC_1164.ALL;\n")
-        f.write("use IEEE.NUMERIC_STD.ALL;\n\n")
-        f.write("-- Entity generated automatically from XDC file\n")
-        f.write("-- Port directions extracted from #! or ##! comments\n")
-        f.write(f"entity {entity_name} is\n")
-        f.write("    Port (\n")
-
-        # Collect all ports for proper comma/semicolon handling
-        all_ports = []
-        
-        # Process scalar ports
-        for port, direction in sorted(scalars.items()):
-            dir_str = direction if direction else "   "
-            all_ports.append(f"        {port} : {dir_str} std_logic")
-        
-        # Process bus ports
-        for base_name, indices_directions in sorted(ports_dict.items()):
-            if indices_directions:
-                # Extract just the indices
-                indices = [idx for idx, dir in indices_directions]
-                indices.sort()
-                high_index = max(indices)
-                low_index = min(indices)
-                
-                # Determine direction (use the most common direction if multiple specified)
-                directions = [dir for idx, dir in indices_directions if dir]
-                direction = max(set(directions), key=directions.count) if directions else None
-                dir_str = direction if direction else "   "
-                
-                # Determine if it's downto or to (assuming downto by convention)
-                range_str = f"({high_index} downto {low_index})"
-                all_ports.append(f"        {base_name} : {dir_str} std_logic_vector{range_str}")
-        
-        # Write all ports with proper punctuation
-        for i, port_line in enumerate(all_ports):
-            if i == len(all_ports) - 1:
-                f.write(f"{port_line}\n")
-            else:
-                f.write(f"{port_line};\n")
-        
-        f.write("    );\n")
-        f.write(f"end entity {entity_name};\n\n")
-        
-        # Add architecture with internal signals
-        f.write(f"architecture Behavioral of {entity_name} is\n")
-        
-        # Generate signals if requested or if assignments are requested
-        if generate_signals or generate_assignments:
-            f.write("    -- Internal signals\n")
-            
-            # Declare internal signals for scalar ports
-            for port, direction in sorted(scalars.items()):
-                if direction == "inout":
-                    # For INOUT ports, create _In, _Out, and _Dir signals
-                    f.write(f"    signal {port}_In  : std_logic; -- Input from {port}\n")
-                    f.write(f"    signal {port}_Out : std_logic := '0'; -- Output to {port}\n")
-                    f.write(f"    signal {port}_Dir : std_logic := '0'; -- Direction control for {port} (1=output, 0=input)\n")
-                else:
-                    f.write(f"    signal {port}_Int : std_logic := '0';\n")
-            
-            # Declare internal signals for bus ports
-            for base_name, indices_directions in sorted(ports_dict.items()):
-                if indices_directions:
-                    # Determine direction (use the most common direction if multiple specified)
-                    directions = [dir for idx, dir in indices_directions if dir]
-                    direction = max(set(directions), key=directions.count) if directions else None
-                    
-                    indices = [idx for idx, dir in indices_directions]
-                    indices.sort()
-                    high_index = max(indices)
-                    low_index = min(indices)
-                    range_str = f"({high_index} downto {low_index})"
-                    
-                    if direction == "inout":
-                        # For INOUT buses, create _In, _Out, and _Dir signals
-                        f.write(f"    signal {base_name}_In  : std_logic_vector{range_str}; -- Input from {base_name}\n")
-                        f.write(f"    signal {base_name}_Out : std_logic_vector{range_str} := (others => '0'); -- Output to {base_name}\n")
-                        f.write(f"    signal {base_name}_Dir : std_logic := '0'; -- Direction control for {base_name} (1=output, 0=input)\n")
-                    else:
-                        f.write(f"    signal {base_name}_Int : std_logic_vector{range_str} := (others => '0');\n")
-        else:
-            f.write("    -- Declare internal signals here if needed\n")
+    # Process scalar ports
+    for port, direction in scalars_sorted:
+        dir_str = direction if direction else "   "
+        all_ports.append(f"        {port} : {dir_str} std_logic")
+    
+    # Process bus ports
+    for base_name, (range_str, direction) in buses_sorted:
+        dir_str = direction if direction else "   "
+        all_ports.append(f"        {base_name} : {dir_str} std_logic_vector{range_str}")
+    
+    # Write all ports with proper punctuation (no semicolon after the last one)
+    if all_ports:
+        out.append(";\n".join(all_ports) + "\n")
+    
+    # Close the entity and open the architecture that holds the internal signals
+    out.append(_ENTITY_END_TMPL.format(n=entity_name))
+    
+    # Generate signals if requested or if assignments are requested
+    if generate_signals or generate_assignments:
+        out.append("    -- Internal signals\n")
         
-        f.write("begin\n")
+        # Declare internal signals for scalar ports
+        # (INOUT ports get _In, _Out, and _Dir signals, all others a single _Int signal)
+        for port, direction in scalars_sorted:
+            out.append(_SIGNAL_TMPLS.get(direction, _SIGNAL_DEFAULT_TMPL).format(n=port))
         
-        # Generate assignments if requested
-        if generate_assignments:
-            f.write("    -- Port to signal assignments\n")
-            
-            # Generate assignments for scalar ports
-            for port, direction in sorted(scalars.items()):
-                if direction == "in":
-                    f.write(f"    {port}_Int <= {port};\n")
-                elif direction == "out":
-                    f.write(f"    {port} <= {port}_Int;\n")
-                elif direction == "inout":
-                    f.write(f"    -- INOUT port {port} requires special handling\n")
-                    f.write(f"    {port}_In <= {port};\n")
-                    f.write(f"    {port} <= {port}_Out when {port}_Dir = '1' else 'Z';\n")
-                    f.write(f"    -- Control {port}_Dir to switch between input and output modes\n\n")
-                else:
-                    f.write(f"    -- Direction not specified for {port}, add assignment manually\n")
-            
-            # Generate assignments for bus ports
-            for base_name, indices_directions in sorted(ports_dict.items()):
-                if indices_directions:
-                    # Determine direction (use the most common direction if multiple specified)
-                    directions = [dir for idx, dir in indices_directions if dir]
-                    direction = max(set(directions), key=directions.count) if directions else None
-                    
-                    if direction == "in":
-                        f.write(f"    {base_name}_Int <= {base_name};\n")
-                    elif direction == "out":
-                        f.write(f"    {base_name} <= {base_name}_Int;\n")
-                    elif direction == "inout":
-                        f.write(f"    -- INOUT bus {base_name} requires special handling\n")
-                        f.write(f"    {base_name}_In <= {base_name};\n")
-                        f.write(f"    {base_name} <= {base_name}_Out when {base_name}_Dir = '1' else (others => 'Z');\n")
-                        f.write(f"    -- Control {base_name}_Dir to switch between input and output modes\n\n")
-                    else:
-                        f.write(f"    -- Direction not specified for {base_name}, add assignment manually\n")
-            
-            f.write("\n")
+        # Declare internal signals for bus ports
+        for base_name, (range_str, direction) in buses_sorted:
+            out.append(_BUS_SIGNAL_TMPLS.get(direction, _BUS_SIGNAL_DEFAULT_TMPL).format(n=base_name, r=range_str))
+    else:
+        out.append("    -- Declare internal signals here if needed\n")
+    
+    out.append("begin\n")
+    
+    # Usage examples for INOUT ports, collected while writing the assignments
+    examples = []
+
+    # Generate assignments if requested
+    if generate_assignments:
+        out.append("    -- Port to signal assignments\n")
         
-        f.write("    -- Add your logic here\n")
+        # Generate assignments for scalar ports
+        for port, direction in scalars_sorted:
+            out.append(_ASSIGN_TMPLS.get(direction, _ASSIGN_DEFAULT_TMPL).format(n=port))
+            if direction == "inout":
+                examples.append(_INOUT_EXAMPLE_TMPL.format(n=port))
         
-        if generate_assignments:
-            f.write("    -- Logic using internal signals\n")
-            # Add examples for INOUT ports
-            for port, direction in sorted(scalars.items()):
-                if direction == "inout":
-                    f.write(f"    -- Example usage for {port}:\n")
-                    f.write(f"    -- {port}_Out <= some_internal_signal; -- Drive output\n")
-                    f.write(f"    -- some_other_signal <= {port}_In;     -- Read input\n")
-                    f.write(f"    -- {port}_Dir <= '1' when output_enable else '0'; -- Control direction\n\n")
-            
-            for base_name, indices_directions in sorted(ports_dict.items()):
-                if indices_directions:
-                    directions = [dir for idx, dir in indices_directions if dir]
-                    direction = max(set(directions), key=directions.count) if directions else None
-                    if direction == "inout":
-                        f.write(f"    -- Example usage for {base_name}:\n")
-                        f.write(f"    -- {base_name}_Out <= some_internal_bus; -- Drive output\n")
-                        f.write(f"    -- some_other_bus <= {base_name}_In;     -- Read input\n")
-                        f.write(f"    -- {base_name}_Dir <= '1' when output_enable else '0'; -- Control direction\n\n")
-        else:
-            f.write("    -- Connect internal signals to ports if needed\n")
+        # Generate assignments for bus ports
+        for base_name, (_, direction) in buses_sorted:
+            out.append(_BUS_ASSIGN_TMPLS.get(direction, _ASSIGN_DEFAULT_TMPL).format(n=base_name))
+            if direction == "inout":
+                examples.append(_INOUT_BUS_EXAMPLE_TMPL.format(n=base_name))
         
-        f.write("end architecture Behavioral;\n")
-
-    print(f"Complete VHDL file written to {output_filename}")
+        out.append("\n")
     
-    # Print summary of directions used
-    print("\nDirection summary:")
-    for port, direction in sorted(scalars.items()):
-        dir_str = direction if direction else "NOT SPECIFIED"
-        print(f"  {port}: {dir_str}")
-        
-    for base_name, indices_directions in sorted(ports_dict.items()):
-        directions = [dir for idx, dir in indices_directions if dir]
-        direction = max(set(directions), key=directions.count) if directions else "NOT SPECIFIED"
-        print(f"  {base_name}: {direction}")
-
-if __name__ == "__main__":
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Convert XDC file to VHDL entity with optional signal declarations and assignments')
-    parser.add_argument('input_file', help='Input XDC file')
-    parser.add_argument('output_file', help='Output VHDL file')
-    parser.add_argument('-s', '--signals', action='store_true', 
-                        help='Generate internal signal declarations')
-    parser.add_argument('-as', '--assign-signals', action='store_true', 
-                        help='Generate signal declarations and assignments between ports and signals')
+    out.append("    -- Add your logic here\n")
     
-    args = parser.parse_args()
+    if generate_assignments:
+        out.append("    -- Logic using internal signals\n")
+        # Add examples for INOUT ports
+        out.extend(examples)
+    else:
+        out.append("    -- Connect internal signals to ports if needed\n")
     
-    input_file = args.input_file
-    output_file = args.output_file
-    generate_signals = args.signals
-    generate_assignments = args.assign_signals
+    out.append("end architecture Behavioral;\n")
+
+    with open(output_filename, 'w', buffering=1 << 16) as f:
+        f.write("".join(out))
+
+    # Report the output file and a summary of directions used, written to stdout in one call
+    summary = [f"Complete VHDL file written to {output_filename}", "\nDirection summary:"]
+    summary.extend(f"  {port}: {direction or 'NOT SPECIFIED'}" for port, direction in scalars_sorted)
+    summary.extend(f"  {base_name}: {direction or 'NOT SPECIFIED'}" for base_name, (_, direction) in buses_sorted)
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
+
+if __name__ == "__main__":
+    input_file, output_file, generate_signals, generate_assignments = parse_args(sys.argv[1:], os.path.basename(sys.argv[0]))
     
     # If assignments are requested, signals are also needed
     if generate_assignments: